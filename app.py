@@ -1,29 +1,170 @@
 from shiny import App, ui, reactive, render
 import asyncio
 import websockets
-import json
-import pandas as pd
+import orjson
+import numpy as np
+import plotly
 import plotly.graph_objects as go
+import plotly.io as pio
 from datetime import datetime
+from pathlib import Path
 import threading
-import queue
 import logging
 
 # Set up logging for debugging
 logging.basicConfig(level=logging.INFO)
 
-# Thread-safe queue for WebSocket updates
-update_queue = queue.Queue()
+# plotly.js bundled with the installed plotly package, served locally so the
+# dashboard works on a LAN without internet access
+PLOTLY_JS_DIR = Path(plotly.__file__).parent / "package_data"
+
+class LatestValueSlot:
+    """Thread-safe holder that keeps only the most recently set value, with a version counter."""
+
+    __slots__ = ("_lock", "_value", "_version")
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._value = None
+        self._version = 0
+
+    def set(self, value):
+        """Store a value, replacing the previous one and bumping the version."""
+        with self._lock:
+            self._value = value
+            self._version += 1
+
+    def get(self):
+        """Return (version, value) without clearing it; version 0 means nothing was set yet."""
+        with self._lock:
+            return self._version, self._value
+
+# Latest rooms snapshot from the ESP32; stale snapshots are overwritten rather than queued
+latest_rooms = LatestValueSlot()
 
 # Global state
 rooms = {}  # Dictionary to store room data
+rooms_version = 0  # Version of latest_rooms last applied to rooms
 ws_connected = False  # WebSocket connection status
 esp32_ip = "192.168.183.165"  # Default ESP32 IP (adjust as needed)
 WS_SERVER_URL = f"ws://{esp32_ip}:81"
-reconnect_event = threading.Event()  # Event to signal WebSocket reconnection
+# Long-lived event loop for the WebSocket connection, run in a daemon thread below.
+# Created at import so handlers can schedule work on it before the thread starts.
+ws_loop = asyncio.new_event_loop()
+# Created in start_websocket so they bind to ws_loop on every Python version;
+# only touch them from callbacks running on ws_loop.
+reconnect_event = None  # asyncio.Event signalling the WebSocket to reconnect
+outbound = None  # asyncio.Queue of commands waiting to be sent to the ESP32
+outbound_epoch = 0  # Bumped when outbound is discarded, so in-flight batches aren't requeued
+command_url = WS_SERVER_URL  # URL that queued commands were issued against (ws_loop only)
+HISTORY_SIZE = 50  # Number of power samples kept per room
+MAX_PLOT_POINTS = 1000  # Histories longer than this are downsampled before plotting
+BATCH_WINDOW = 0.05  # Seconds to collect outbound commands into a single frame
+MAX_BATCH = 10  # Most commands per frame; must fit the firmware's 4096-byte JSON document
+THRESHOLD_DEBOUNCE = 0.25  # Seconds a threshold input must settle before it is sent
+pending_thresholds = {}  # room_id -> TimerHandle for the pending threshold update
 
 #### WebSocket Handling
 
+async def recv_loop(websocket):
+    """Receive messages from the ESP32 until the connection drops or a reconnect is requested."""
+    reconnect = asyncio.create_task(reconnect_event.wait())
+    try:
+        while True:
+            # Sleep until either a message or a reconnect request arrives
+            receive = asyncio.create_task(websocket.recv())
+            done, _ = await asyncio.wait({receive, reconnect}, return_when=asyncio.FIRST_COMPLETED)
+            if reconnect in done:
+                receive.cancel()
+                return
+            try:
+                message = receive.result()
+            except websockets.ConnectionClosed:
+                return
+            data = orjson.loads(message)
+            if data.get("type") == "rooms":
+                # Push the raw room list; the consumer builds the dict
+                latest_rooms.set(data["rooms"])
+    finally:
+        reconnect.cancel()
+
+async def drain(q, window=0, limit=None):
+    """Wait for one item, then take up to `limit` items queued within the next `window` seconds."""
+    while True:
+        items = [await q.get()]
+        epoch = outbound_epoch
+        if window:
+            try:
+                await asyncio.sleep(window)
+            except asyncio.CancelledError:
+                requeue(q, items, epoch)
+                raise
+        if epoch == outbound_epoch:
+            break
+        # The queue was discarded during the window; these items are stale
+    while limit is None or len(items) < limit:
+        try:
+            items.append(q.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    return items
+
+def requeue(q, items, epoch):
+    """Put items back at the front of q, ahead of anything queued since (runs on ws_loop).
+
+    Items taken before the queue was last discarded (an older `epoch`) are dropped instead.
+    """
+    if epoch != outbound_epoch:
+        return
+    while True:
+        try:
+            items.append(q.get_nowait())
+        except asyncio.QueueEmpty:
+            break
+    for item in items:
+        q.put_nowait(item)
+
+def discard_outbound():
+    """Drop queued and debounced commands so they aren't sent to another device (runs on ws_loop)."""
+    global outbound_epoch
+    outbound_epoch += 1
+    for room_id in list(pending_thresholds):
+        cancel_threshold(room_id)
+    dropped = 0
+    while True:
+        try:
+            outbound.get_nowait()
+        except asyncio.QueueEmpty:
+            break
+        dropped += 1
+    if dropped:
+        logging.info(f"Dropped {dropped} queued command(s) for the previous ESP32")
+
+async def send_loop(websocket):
+    """Forward queued commands to the ESP32 over the open connection."""
+    while True:
+        # Give a burst of input a moment to arrive, then send it as one frame
+        # Anything beyond MAX_BATCH stays queued for the next frame
+        commands = await drain(outbound, BATCH_WINDOW, MAX_BATCH)
+        epoch = outbound_epoch  # Still current: nothing awaited since drain checked it
+        if len(commands) > 1:
+            command = {"type": "batch", "cmds": commands}
+        else:
+            command = commands[0]
+        try:
+            # The ESP32 only handles text frames, so decode orjson's bytes
+            await websocket.send(orjson.dumps(command).decode())
+            logging.info(f"Sent command: {command}")
+        except asyncio.CancelledError:
+            # Reconnecting mid-send; keep the commands for the next connection
+            requeue(outbound, commands, epoch)
+            raise
+        except websockets.ConnectionClosed as e:
+            # Keep the commands for the next connection
+            requeue(outbound, commands, epoch)
+            logging.error(f"Command send failed: {e}")
+            return
+
 async def connect_websocket():
     """Connect to the ESP32 WebSocket server and process incoming messages."""
     global ws_connected
@@ -31,68 +172,134 @@ async def connect_websocket():
         try:
             async with websockets.connect(WS_SERVER_URL) as websocket:
                 # Identify this client to the server
-                await websocket.send(json.dumps({"type": "identify", "client": "shiny"}))
-                update_queue.put({"type": "ws_connected", "value": True})
+                await websocket.send(orjson.dumps({"type": "identify", "client": "shiny"}).decode())
                 ws_connected = True
-                while not reconnect_event.is_set():
-                    try:
-                        message = await asyncio.wait_for(websocket.recv(), timeout=1.0)
-                        data = json.loads(message)
-                        if data.get("type") == "rooms":
-                            # Update rooms dictionary with new data
-                            update_queue.put({"type": "rooms", "value": {room["id"]: room for room in data["rooms"]}})
-                    except asyncio.TimeoutError:
-                        continue  # No message, keep checking
-                    except websockets.ConnectionClosed:
-                        break
+                sender = asyncio.create_task(send_loop(websocket))
+                try:
+                    await recv_loop(websocket)
+                finally:
+                    sender.cancel()
                 reconnect_event.clear()  # Reset the event after exiting inner loop
         except Exception as e:
             logging.error(f"WebSocket connection failed: {e}")
-            update_queue.put({"type": "ws_connected", "value": False})
             ws_connected = False
             await asyncio.sleep(5)  # Wait before retrying
 
 def start_websocket():
     """Run the WebSocket connection in a separate thread."""
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    loop.run_until_complete(connect_websocket())
+    global reconnect_event, outbound
+    asyncio.set_event_loop(ws_loop)
+    reconnect_event = asyncio.Event()
+    outbound = asyncio.Queue()
+    ws_loop.run_until_complete(connect_websocket())
 
 # Start WebSocket thread
 websocket_thread = threading.Thread(target=start_websocket, daemon=True)
 websocket_thread.start()
 
-async def send_command(action, **kwargs):
-    """Send a command to the ESP32 via WebSocket."""
-    try:
-        async with websockets.connect(WS_SERVER_URL) as websocket:
-            command = {"type": "command", "action": action, **kwargs}
-            await websocket.send(json.dumps(command))
-            logging.info(f"Sent command: {command}")
-    except Exception as e:
-        logging.error(f"Command send failed: {e}")
+def make_command(action, **kwargs):
+    """Build a command message for the ESP32."""
+    return {"type": "command", "action": action, **kwargs}
+
+def enqueue_command(command):
+    """Add a command to the outbound queue (runs on ws_loop)."""
+    outbound.put_nowait(command)
+
+def request_reconnect(url):
+    """Ask the WebSocket to reconnect, dropping commands queued for a different ESP32 (runs on ws_loop)."""
+    global command_url
+    # Callbacks run in order, so only commands sent before the IP change are dropped
+    if url != command_url:
+        discard_outbound()
+        command_url = url
+    reconnect_event.set()
+
+def send_command(action, **kwargs):
+    """Queue a command for the ESP32 without blocking the calling thread."""
+    ws_loop.call_soon_threadsafe(enqueue_command, make_command(action, **kwargs))
+
+def debounce_threshold(room_id, threshold):
+    """Schedule a threshold update, replacing any pending one for the room (runs on ws_loop)."""
+    cancel_threshold(room_id)
+    pending_thresholds[room_id] = ws_loop.call_later(
+        THRESHOLD_DEBOUNCE, flush_threshold, room_id, threshold
+    )
+
+def flush_threshold(room_id, threshold):
+    """Queue the settled threshold value for sending (runs on ws_loop)."""
+    pending_thresholds.pop(room_id, None)
+    outbound.put_nowait(make_command("update", room_id=room_id, threshold=threshold))
+
+def cancel_threshold(room_id):
+    """Drop any pending threshold update for the room (runs on ws_loop)."""
+    handle = pending_thresholds.pop(room_id, None)
+    if handle is not None:
+        handle.cancel()
 
 #### Power Graph Generation
 
-def create_power_graph(room_id):
-    """Generate a real-time power consumption graph for a room."""
-    room = rooms.get(room_id)
-    if not room or "display_power" not in room:
-        return None
+def append_sample(room, timestamp, power):
+    """Write a sample into the room's ring buffer, overwriting the oldest when full."""
+    slot = room["idx"] % HISTORY_SIZE
+    room["ts"][slot] = timestamp
+    room["pw"][slot] = power
+    room["idx"] += 1
+    room["count"] = min(room["count"] + 1, HISTORY_SIZE)
 
-    current_time = datetime.now()
-    if "data" not in room:
-        room["data"] = []
-    room["data"].append({"timestamp": current_time, "power": room["display_power"]})
-    if len(room["data"]) > 50:  # Limit data points
-        room["data"].pop(0)
+def record_sample(room):
+    """Append the room's current power to its history, creating the buffers on first use."""
+    if "ts" not in room:
+        room["ts"] = np.empty(HISTORY_SIZE, dtype="datetime64[us]")
+        room["pw"] = np.empty(HISTORY_SIZE, dtype=np.float32)
+        room["idx"] = 0
+        room["count"] = 0
+    append_sample(room, datetime.now(), room["display_power"])
 
-    df = pd.DataFrame(room["data"])
+def room_history(room):
+    """Return the room's buffered timestamps and powers in chronological order."""
+    count = room["count"]
+    if count < HISTORY_SIZE:
+        return room["ts"][:count], room["pw"][:count]
+    start = room["idx"] % HISTORY_SIZE
+    order = np.r_[start:HISTORY_SIZE, 0:start]
+    return room["ts"][order], room["pw"][order]
 
+def downsample_lttb(x, y, n_out):
+    """Reduce a series to n_out points with Largest-Triangle-Three-Buckets."""
+    n = len(y)
+    if n <= n_out or n_out < 3:
+        return x, y
+    xf = x.astype("int64").astype(np.float64)
+    yf = y.astype(np.float64)
+
+    # First and last points are always kept; the rest are split into buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    keep = np.empty(n_out, dtype=np.int64)
+    keep[0], keep[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 2 < len(edges):
+            next_start, next_end = edges[i + 1], edges[i + 2]
+        else:
+            next_start, next_end = n - 1, n
+        avg_x = xf[next_start:next_end].mean()
+        avg_y = yf[next_start:next_end].mean()
+        # Pick the point forming the largest triangle with the previous pick and the next bucket's average
+        area = np.abs(
+            (xf[a] - avg_x) * (yf[start:end] - yf[a])
+            - (xf[a] - xf[start:end]) * (avg_y - yf[a])
+        )
+        a = start + int(np.argmax(area))
+        keep[i + 1] = a
+    return x[keep], y[keep]
+
+def build_power_figure(room_id, room):
+    """Build the static layout of a room's power graph with an empty trace."""
     fig = go.Figure()
-    fig.add_trace(go.Scatter(
-        x=df["timestamp"],
-        y=df["power"],
+    fig.add_trace(go.Scattergl(
+        x=[],
+        y=[],
         name="Power",
         line=dict(color="blue", width=2)
     ))
@@ -105,11 +312,78 @@ def create_power_graph(room_id):
     fig.update_layout(
         title=f"{room['name']} Power Consumption",
         xaxis_title="Time",
+        xaxis=dict(type="date"),
         yaxis_title="Power (W)",
-        height=400
+        height=400,
+        transition_duration=0,
+        uirevision=str(room_id)  # Keep zoom/pan state across updates
     )
     return fig
 
+def create_power_graph(room_id):
+    """Generate a real-time power consumption graph for a room."""
+    room = rooms.get(room_id)
+    if not room or "ts" not in room:
+        return None
+
+    # Reuse the previous figure when nothing it shows has changed
+    key = (room["idx"], room["threshold"])
+    if room.get("_fig_key") == key:
+        return room["_fig"]
+
+    if "_fig" not in room:
+        room["_fig"] = build_power_figure(room_id, room)
+
+    # Only the trace data and threshold line change between frames
+    fig = room["_fig"]
+    timestamps, powers = downsample_lttb(*room_history(room), MAX_PLOT_POINTS)
+    fig.data[0].x = timestamps
+    fig.data[0].y = powers
+    fig.layout.shapes[0].y0 = fig.layout.shapes[0].y1 = room["threshold"]
+    fig.layout.annotations[0].y = room["threshold"]
+    fig.layout.datarevision = room["idx"]  # Total samples seen, so it changes even once the buffer is full
+    room["_fig_key"] = key
+    return fig
+
+#### Room Updates
+
+def apply_latest_rooms():
+    """Apply the newest rooms snapshot to rooms, once per snapshot however many sessions call this."""
+    global rooms_version
+    version, new_rooms = latest_rooms.get()
+    if version == rooms_version:
+        return
+    rooms_version = version
+
+    new_ids = set()
+    for room in new_rooms:
+        room_id = room["id"]
+        new_ids.add(room_id)
+        # Update rooms in place so history buffers and cached figures survive
+        current = rooms.get(room_id)
+        if current is None:
+            current = rooms[room_id] = dict(room)
+            changed = True
+        else:
+            changed = any(current.get(key) != value for key, value in room.items())
+            current.update(room)
+        if not changed:
+            continue
+        if "display_power" in room:
+            record_sample(current)
+        # Sessions compare this against the last version they pushed to their outputs
+        current["_snapshot"] = room
+        current["_changed"] = version
+    for room_id in list(rooms):
+        if room_id not in new_ids:
+            del rooms[room_id]
+    logging.info(f"Updated rooms: {list(rooms.keys())}")
+
+def plotly_react(div_id, fig):
+    """Return a script that draws or patches a figure in place with Plotly.react."""
+    payload = pio.to_json(fig, validate=False, engine="orjson").replace("</", "<\\/")
+    return ui.tags.script(ui.HTML(f"Plotly.react({orjson.dumps(div_id).decode()}, {payload});"))
+
 #### UI Definition
 
 app_ui = ui.page_sidebar(
@@ -129,6 +403,7 @@ app_ui = ui.page_sidebar(
         )
     ),
     main=ui.panel(
+        ui.head_content(ui.tags.script(src="plotly/plotly.min.js")),
         ui.h2("Power Monitoring Dashboard"),
         ui.output_ui("rooms_display")
     )
@@ -138,18 +413,31 @@ app_ui = ui.page_sidebar(
 
 def server(input, output, session):
     global rooms, ws_connected, WS_SERVER_URL, esp32_ip
+    # room_id -> reactive.Value with the room's latest ESP32 snapshot. Each value lives as
+    # long as the room's outputs, which subscribe to it (see sync_dynamic_outputs).
+    room_state = {}
+    seen_version = 0  # rooms_version this session last pushed into room_state
 
     @reactive.Effect
-    def update_from_queue():
-        """Process updates from the WebSocket queue."""
-        while not update_queue.empty():
-            update = update_queue.get()
-            if update["type"] == "ws_connected":
-                ws_connected = update["value"]
-            elif update["type"] == "rooms":
-                rooms.clear()
-                rooms.update(update["value"])
-                logging.info(f"Updated rooms: {list(rooms.keys())}")
+    def apply_rooms_snapshot():
+        """Push rooms changed since this session last looked into its reactive values."""
+        nonlocal seen_version
+        # The WebSocket thread can't invalidate Shiny, so check the slot periodically
+        reactive.invalidate_later(0.5)
+
+        apply_latest_rooms()
+        if rooms_version == seen_version:
+            return
+        # Invalidate only the rooms whose snapshot actually changed
+        for room_id, room in rooms.items():
+            if room.get("_changed", 0) <= seen_version:
+                continue
+            state = room_state.get(room_id)
+            if state is None:
+                room_state[room_id] = reactive.Value(room["_snapshot"])
+            else:
+                state.set(room["_snapshot"])
+        seen_version = rooms_version
 
     @reactive.Effect
     @reactive.event(input.esp32_ip)
@@ -158,19 +446,29 @@ def server(input, output, session):
         global WS_SERVER_URL, esp32_ip
         esp32_ip = input.esp32_ip()
         WS_SERVER_URL = f"ws://{esp32_ip}:81"
-        reconnect_event.set()  # Signal WebSocket to reconnect
+        ws_loop.call_soon_threadsafe(request_reconnect, WS_SERVER_URL)  # Signal WebSocket to reconnect
         logging.info(f"Updated ESP32 IP to {esp32_ip}")
 
+    # Reactive views of plain globals that only invalidate when the value changes
+    @reactive.poll(lambda: ws_connected, 1.0)
+    def ws_state():
+        return ws_connected
+
+    @reactive.poll(lambda: tuple(rooms.keys()), 0.5)
+    def room_ids():
+        return tuple(rooms.keys())
+
     @output
     @render.text
     def connection_status():
         """Display WebSocket connection status."""
-        return "Connected to ESP32" if ws_connected else "Disconnected from ESP32"
+        return "Connected to ESP32" if ws_state() else "Disconnected from ESP32"
 
     @output
     @render.ui
     def rooms_display():
-        """Render dynamic room cards."""
+        """Render dynamic room cards (only when rooms are added or removed)."""
+        room_ids()
         if not rooms:
             return ui.p("No rooms available. Add a room using the sidebar.")
 
@@ -186,7 +484,8 @@ def server(input, output, session):
                     max=10000
                 ),
                 ui.output_text(f"status_{room_id}"),
-                ui.output_plot(f"graph_{room_id}"),
+                ui.div(id=f"plot_{room_id}"),
+                ui.output_ui(f"graph_{room_id}"),
                 ui.row(
                     ui.column(6, ui.input_action_button(f"reset_{room_id}", "Reset Power")),
                     ui.column(6, ui.input_action_button(f"delete_{room_id}", "Delete Room"))
@@ -196,18 +495,32 @@ def server(input, output, session):
         return ui.div(*room_cards)
 
     # Dynamic outputs and event handlers for each room
+    room_handlers = {}  # room_id -> Effects handling that room's inputs
+
     @reactive.Effect
-    def register_dynamic_outputs():
-        """Register dynamic outputs and handlers for each room."""
-        for room_id in list(rooms.keys()):
+    def sync_dynamic_outputs():
+        """Register outputs and handlers for new rooms and tear down those of removed rooms."""
+        current = room_ids()
+        for room_id in [r_id for r_id in room_handlers if r_id not in current]:
+            for effect in room_handlers.pop(room_id):
+                effect.destroy()
+            # Dropped together with the handlers so a returning room gets fresh outputs
+            room_state.pop(room_id, None)
+
+        for room_id in current:
+            if room_id in room_handlers:
+                continue
+            if room_id not in room_state:
+                room_state[room_id] = reactive.Value(rooms.get(room_id, {}).get("_snapshot", {}))
+
             # Create a closure for each room_id
             def create_status_renderer(r_id):
+                state = room_state[r_id]
+
                 @output(id=f"status_{r_id}")
                 @render.text
                 def status_text():
-                    room = rooms.get(r_id)
-                    if not room:
-                        return ""
+                    room = state()
                     status = ""
                     if room.get("isCutoff", False):
                         status += "⚠️ Power Cut Off - Threshold Exceeded!\n"
@@ -217,24 +530,34 @@ def server(input, output, session):
                 return status_text
             
             def create_graph_renderer(r_id):
+                state = room_state[r_id]
+
                 @output(id=f"graph_{r_id}")
-                @render.plot
+                @render.ui
                 def graph_plot():
-                    return create_power_graph(r_id)
+                    # Depend only on this room's state so other rooms' updates don't redraw it
+                    state()
+                    fig = create_power_graph(r_id)
+                    if fig is None:
+                        return None
+                    # Patch the persistent plot div rather than sending a new widget
+                    return plotly_react(f"plot_{r_id}", fig)
                 return graph_plot
             
             def create_reset_handler(r_id):
                 @reactive.Effect
                 @reactive.event(input[f"reset_{r_id}"])
                 def reset_handler():
-                    asyncio.run(send_command("reconnect", room_id=r_id))
+                    send_command("reconnect", room_id=r_id)
                 return reset_handler
             
             def create_delete_handler(r_id):
                 @reactive.Effect
                 @reactive.event(input[f"delete_{r_id}"])
                 def delete_handler():
-                    asyncio.run(send_command("remove", room_id=r_id))
+                    # Runs before the remove is queued, so no debounced update follows it
+                    ws_loop.call_soon_threadsafe(cancel_threshold, r_id)
+                    send_command("remove", room_id=r_id)
                     if r_id in rooms:
                         del rooms[r_id]
                         logging.info(f"Deleted room: {r_id}")
@@ -246,31 +569,34 @@ def server(input, output, session):
                 def threshold_handler():
                     new_threshold = input[f"threshold_{r_id}"]()
                     if new_threshold is not None and r_id in rooms:
-                        asyncio.run(send_command("update", room_id=r_id, threshold=float(new_threshold)))
+                        # Only the last value within the debounce window is sent
+                        ws_loop.call_soon_threadsafe(debounce_threshold, r_id, float(new_threshold))
                         rooms[r_id]["threshold"] = new_threshold
                         logging.info(f"Updated threshold for room {r_id} to {new_threshold}")
                 return threshold_handler
             
-            # Register all handlers for this room
+            # Register all handlers for this room; re-registering an output ID replaces it
             create_status_renderer(room_id)
             create_graph_renderer(room_id)
-            create_reset_handler(room_id)
-            create_delete_handler(room_id)
-            create_threshold_handler(room_id)
+            room_handlers[room_id] = [
+                create_reset_handler(room_id),
+                create_delete_handler(room_id),
+                create_threshold_handler(room_id),
+            ]
 
     @reactive.Effect
     @reactive.event(input.add_room)
     def handle_add_room():
         """Add a new room via WebSocket command."""
         room_id = f"room_{len(rooms) + 1}"
-        asyncio.run(send_command(
+        send_command(
             "add",
             room_id=room_id,
             name=input.new_room_name(),
             threshold=float(input.new_threshold()),
             meas_pin=int(input.meas_pin()),
             cutoff_pin=int(input.cutoff_pin())
-        ))
+        )
         logging.info(f"Sent add command for room: {room_id}")
 
-app = App(app_ui, server)
\ No newline at end of file
+app = App(app_ui, server, static_assets={"/plotly": PLOTLY_JS_DIR})
\ No newline at end of file
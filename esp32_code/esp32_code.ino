@@ -138,67 +138,78 @@ void webSocketEvent(uint8_t num, WStype_t type, uint8_t * payload, size_t length
     }
 }
 
-void handleWebSocketMessage(uint8_t * payload, size_t length) {
-    DynamicJsonDocument doc(1024);
-    DeserializationError error = deserializeJson(doc, payload, length);
+void handleCommand(JsonObject cmd) {
+    String action = cmd["action"];
+    String roomId = cmd["room_id"];
     
-    if (error) {
-        Serial.println("JSON parsing failed!");
-        return;
-    }
+    Serial.printf("Received command: %s for room %s\n", action.c_str(), roomId.c_str());
     
-    // Handle command message from Streamlit
-    if (doc["type"] == "command") {
-        String action = doc["action"];
-        String roomId = doc["room_id"];
+    if (action == "add") {
+        String name = cmd["name"];
+        float threshold = cmd["threshold"];
+        uint8_t measPin = cmd["meas_pin"];
+        uint8_t cutoffPin = cmd["cutoff_pin"];
         
-        Serial.printf("Received command: %s for room %s\n", action.c_str(), roomId.c_str());
+        rooms.emplace_back(roomId, name, measPin, cutoffPin, threshold);
+        Serial.printf("Added new room: %s\n", name.c_str());
+        sendRoomData();
+    }
+    else if (action == "remove") {
+        auto it = std::remove_if(rooms.begin(), rooms.end(),
+            [roomId](const EnergyRoom& r){ return r.getId() == roomId; });
         
-        if (action == "add") {
-            String name = doc["name"];
-            float threshold = doc["threshold"];
-            uint8_t measPin = doc["meas_pin"];
-            uint8_t cutoffPin = doc["cutoff_pin"];
-            
-            rooms.emplace_back(roomId, name, measPin, cutoffPin, threshold);
-            Serial.printf("Added new room: %s\n", name.c_str());
+        if (it != rooms.end()) {
+            digitalWrite(it->getCutoffPin(), LOW);
+            rooms.erase(it, rooms.end());
+            Serial.printf("Removed room ID: %s\n", roomId.c_str());
             sendRoomData();
         }
-        else if (action == "remove") {
-            auto it = std::remove_if(rooms.begin(), rooms.end(),
-                [roomId](const EnergyRoom& r){ return r.getId() == roomId; });
-            
-            if (it != rooms.end()) {
-                digitalWrite(it->getCutoffPin(), LOW);
-                rooms.erase(it, rooms.end());
-                Serial.printf("Removed room ID: %s\n", roomId.c_str());
+    }
+    else if (action == "update") {
+        float threshold = cmd["threshold"];
+        
+        for (auto& room : rooms) {
+            if (room.getId() == roomId) {
+                room.updateThreshold(threshold);
+                Serial.printf("Updated threshold for room %s to %.2f\n", 
+                             roomId.c_str(), threshold);
                 sendRoomData();
+                break;
             }
         }
-        else if (action == "update") {
-            float threshold = doc["threshold"];
-            
-            for (auto& room : rooms) {
-                if (room.getId() == roomId) {
-                    room.updateThreshold(threshold);
-                    Serial.printf("Updated threshold for room %s to %.2f\n", 
-                                 roomId.c_str(), threshold);
-                    sendRoomData();
-                    break;
-                }
+    }
+    else if (action == "reconnect") {
+        for (auto& room : rooms) {
+            if (room.getId() == roomId) {
+                room.resetPower();
+                Serial.printf("Reset power for room %s\n", roomId.c_str());
+                sendRoomData();
+                break;
             }
         }
-        else if (action == "reconnect") {
-            for (auto& room : rooms) {
-                if (room.getId() == roomId) {
-                    room.resetPower();
-                    Serial.printf("Reset power for room %s\n", roomId.c_str());
-                    sendRoomData();
-                    break;
-                }
-            }
+    }
+}
+
+void handleWebSocketMessage(uint8_t * payload, size_t length) {
+    // Sized for a full batch from the dashboard (MAX_BATCH in app.py)
+    DynamicJsonDocument doc(4096);
+    DeserializationError error = deserializeJson(doc, payload, length);
+    
+    if (error) {
+        Serial.println("JSON parsing failed!");
+        return;
+    }
+    
+    // Handle a batch of commands sent in a single frame
+    if (doc["type"] == "batch") {
+        for (JsonObject cmd : doc["cmds"].as<JsonArray>()) {
+            handleCommand(cmd);
         }
     }
+    // Handle command message from Streamlit
+    else if (doc["type"] == "command") {
+        handleCommand(doc.as<JsonObject>());
+    }
 }
 
 void setup() {